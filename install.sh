@@ -171,6 +171,15 @@ install_system_dependencies() {
         exit 1
     fi
     
+    # Optional: native zxcvbn binding for realistic strength scoring
+    if ! python -c "import zxcvbn_rs_py" 2>/dev/null; then
+        if pip install zxcvbn-rs-py >/dev/null 2>&1; then
+            log_success "Optional zxcvbn-rs-py strength estimator installed"
+        else
+            log_warning "zxcvbn-rs-py not installed, using built-in strength scoring"
+        fi
+    fi
+    
     log_success "Python environment validation completed"
 }
 
@@ -211,6 +220,13 @@ install_application_files() {
         exit 1
     fi
     
+    # Copy optional wordlist and common password data files
+    for data_file in common_10k.txt common.bloom eff_large_wordlist.txt; do
+        if [ -f "src/$data_file" ]; then
+            cp "src/$data_file" "$INSTALL_DIR/" || log_warning "Failed to copy $data_file"
+        fi
+    done
+    
     # Set executable permissions
     chmod +x "$INSTALL_DIR/$SCRIPT_NAME"
     
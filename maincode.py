@@ -13,23 +13,384 @@ Platform: Termux (Android Terminal Emulator)
 """
 
 import random
-import string
-import secrets
 import os
+import functools
+import array
+import itertools
 import sys
-import argparse
+
+# Optional wordlist (one password per line) installed next to this script,
+# e.g. the SecLists top-10k list. Merged into the built-in set when present.
+COMMON_PASSWORDS_FILE = "common_10k.txt"
+
+# Optional precomputed Bloom filter over a large common password corpus,
+# written by build_bloom_filter(). Header is (m bits, k hashes), big-endian.
+COMMON_BLOOM_FILE = "common.bloom"
+_BLOOM_HEADER = ">II"
+
+_BUILTIN_COMMON_PASSWORDS = (
+    '123456', 'password', '12345678', 'qwerty', '123456789', '12345', '1234',
+    '111111', '1234567', 'dragon', '123123', 'baseball', 'abc123', 'football',
+    'monkey', 'letmein', '696969', 'shadow', 'master', '666666', 'qwertyuiop',
+    '123321', 'mustang', '1234567890', 'michael', '654321', 'superman',
+    '1qaz2wsx', '7777777', '121212', '000000', 'qazwsx', '123qwe', 'killer',
+    'trustno1', 'jordan', 'jennifer', 'zxcvbnm', 'asdfgh', 'hunter', 'buster',
+    'soccer', 'harley', 'batman', 'andrew', 'tigger', 'sunshine', 'iloveyou',
+    'charlie', 'robert', 'thomas', 'hockey', 'ranger', 'daniel', 'starwars',
+    '112233', 'george', 'computer', 'michelle', 'jessica', 'pepper', '1111',
+    'zxcvbn', '555555', '11111111', '131313', 'freedom', '777777', 'pass',
+    'maggie', '159753', 'aaaaaa', 'ginger', 'princess', 'joshua', 'cheese',
+    'amanda', 'summer', 'love', 'ashley', 'nicole', 'chelsea', 'matthew',
+    'access', 'yankees', '987654321', 'dallas', 'austin', 'thunder', 'taylor',
+    'matrix', 'welcome', 'admin', 'passw0rd', 'password1', 'login',
+    'qwerty123', 'iloveyou1', 'football1', 'monkey1', 'abc12345',
+)
+
+# Rule-based scorer: length -> length score (index clamped to 64), and
+# strength level index -> label/color (Red, Blue, Yellow, Green)
+_LEN_SCORE_LUT = bytes([0] * 8 + [1] * 4 + [2] * 4 + [3] * 49)
+_LABELS = ("Weak", "Medium", "Strong", "Very Strong")
+_COLORS = ("\033[91m", "\033[94m", "\033[93m", "\033[92m")
+
+# zxcvbn score (0-4) -> strength level index into _LABELS/_COLORS
+_ZXCVBN_LEVELS = (0, 0, 1, 2, 3)
+
+_BUILTIN_COMMON_SET = frozenset(_BUILTIN_COMMON_PASSWORDS)
+
+# The pure-Python zxcvbn package rejects passwords longer than this
+_ZXCVBN_MAX_LENGTH = 72
+
+_COMMON_PASSWORDS = None
+_BLOOM = None
+_ZXCVBN = None
+
+def _zxcvbn_rs_score(zxcvbn, password):
+    """Score a password with the native zxcvbn-rs-py binding."""
+    try:
+        result = zxcvbn(password)
+    except UnicodeEncodeError:
+        result = zxcvbn(password.encode('utf-8', 'replace').decode('utf-8'))
+    feedback = []
+    if result.feedback is not None:
+        if result.feedback.warning is not None:
+            feedback.append(str(result.feedback.warning))
+        feedback.extend(str(suggestion) for suggestion in result.feedback.suggestions)
+    return int(result.score), feedback
+
+def _zxcvbn_py_score(zxcvbn, password):
+    """Score a password with the pure-Python zxcvbn package."""
+    result = zxcvbn(password[:_ZXCVBN_MAX_LENGTH])
+    feedback = []
+    if result['feedback'].get('warning'):
+        feedback.append(result['feedback']['warning'])
+    feedback.extend(result['feedback'].get('suggestions', []))
+    return result['score'], feedback
+
+def _load_zxcvbn():
+    """
+    Import the optional zxcvbn estimator on first use.
+    
+    Prefers the native zxcvbn-rs-py binding and falls back to the
+    pure-Python zxcvbn package.
+    
+    Returns:
+        callable: password -> (score 0-4, feedback list), or None if neither
+        package is installed
+    """
+    global _ZXCVBN
+    if _ZXCVBN is None:
+        try:
+            from zxcvbn_rs_py import zxcvbn
+            _ZXCVBN = functools.partial(_zxcvbn_rs_score, zxcvbn)
+        except ImportError:
+            try:
+                from zxcvbn import zxcvbn
+                _ZXCVBN = functools.partial(_zxcvbn_py_score, zxcvbn)
+            except ImportError:
+                _ZXCVBN = False
+    return _ZXCVBN or None
+
+def _data_path(filename):
+    """Return the path of a data file installed next to this script."""
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), filename)
+
+def _bloom_indices(password, m, k):
+    """Yield the k bit positions for a password using SHA-256 double hashing."""
+    import hashlib
+    
+    digest = hashlib.sha256(password.encode('utf-8', 'surrogatepass')).digest()
+    h1 = int.from_bytes(digest[:4], 'big')
+    h2 = int.from_bytes(digest[4:8], 'big') | 1
+    for i in range(k):
+        yield (h1 + i * h2) % m
+
+def build_bloom_filter(words, path, false_positive_rate=0.001):
+    """
+    Build a Bloom filter file for the common password check.
+    
+    Args:
+        words (iterable): Passwords to add (lowercased before hashing)
+        path (str): Output file path
+        false_positive_rate (float): Target false positive rate
+    
+    Returns:
+        tuple: (m, k) filter parameters
+    """
+    import math
+    import struct
+    
+    words = {word.strip().lower() for word in words if word.strip()}
+    n = max(len(words), 1)
+    m = max(8, int(math.ceil(-n * math.log(false_positive_rate) / (math.log(2) ** 2))))
+    k = max(1, int(round(m / n * math.log(2))))
+    bits = bytearray((m + 7) // 8)
+    for word in words:
+        for idx in _bloom_indices(word, m, k):
+            bits[idx >> 3] |= 1 << (idx & 7)
+    with open(path, 'wb') as bloom_file:
+        bloom_file.write(struct.pack(_BLOOM_HEADER, m, k))
+        bloom_file.write(bits)
+    return m, k
+
+def _load_bloom():
+    """
+    Load the Bloom filter file on first use.
+    
+    The filter is only used when the wordlist is installed alongside it, so
+    that every positive probe can be confirmed against the full set.
+    
+    Returns:
+        tuple: (m, k, bits), or None if no usable filter is installed
+    """
+    global _BLOOM
+    if _BLOOM is None:
+        import struct
+        
+        try:
+            if not os.path.exists(_data_path(COMMON_PASSWORDS_FILE)):
+                raise ValueError("Bloom filter requires the common password wordlist")
+            with open(_data_path(COMMON_BLOOM_FILE), 'rb') as bloom_file:
+                m, k = struct.unpack(_BLOOM_HEADER,
+                                     bloom_file.read(struct.calcsize(_BLOOM_HEADER)))
+                bits = bytearray(bloom_file.read())
+            if m < 1 or k < 1:
+                raise ValueError("invalid Bloom filter parameters")
+            if len(bits) * 8 < m:
+                raise ValueError("truncated Bloom filter")
+            _BLOOM = (m, k, bits)
+        except (OSError, struct.error, ValueError):
+            _BLOOM = False
+    return _BLOOM or None
+
+def _bloom_contains(password):
+    """Return True if the (lowercased) password may be in the Bloom filter."""
+    m, k, bits = _load_bloom()
+    return all(bits[idx >> 3] & (1 << (idx & 7))
+               for idx in _bloom_indices(password, m, k))
+
+def _is_common_password(password):
+    """
+    Check a password against the common password corpus.
+    
+    The built-in list is checked first. When a Bloom filter is installed, a
+    negative probe skips loading the wordlist entirely; a positive probe is
+    confirmed against the wordlist.
+    
+    Args:
+        password (str): Password to check
+    
+    Returns:
+        bool: True if the password is a known common password
+    """
+    password = password.lower()
+    if password in _BUILTIN_COMMON_SET:
+        return True
+    if _load_bloom() is not None and not _bloom_contains(password):
+        return False
+    return password in _load_common_passwords()
+
+def _load_common_passwords():
+    """
+    Load the common password set on first use.
+    
+    Returns:
+        frozenset: Lowercased common passwords
+    """
+    global _COMMON_PASSWORDS
+    if _COMMON_PASSWORDS is None:
+        passwords = set(_BUILTIN_COMMON_PASSWORDS)
+        try:
+            with open(_data_path(COMMON_PASSWORDS_FILE), encoding='utf-8', errors='ignore') as wordlist:
+                passwords.update(line.strip().lower() for line in wordlist if line.strip())
+        except OSError:
+            pass
+        _COMMON_PASSWORDS = frozenset(passwords)
+    return _COMMON_PASSWORDS
+
+def _random_chars(pool, length):
+    """
+    Build a uniformly random string from a pool using bulk os.urandom reads.
+    
+    Bytes at or above the largest multiple of the pool size are rejected so
+    every character stays equally likely.
+    
+    Args:
+        pool (bytes): ASCII characters to draw from (1-256 entries)
+        length (int): Number of characters to generate
+    
+    Returns:
+        str: Generated string
+    """
+    n = len(pool)
+    cutoff = 256 - (256 % n)
+    out = bytearray()
+    while len(out) < length:
+        remaining = length - len(out)
+        for b in os.urandom(remaining + remaining // 4 + 8):
+            if b < cutoff:
+                out.append(pool[b % n])
+                if len(out) == length:
+                    break
+    return out.decode('ascii')
+
+def _random_chars_batch(pool, length, count):
+    """
+    Generate many random strings from one shared os.urandom buffer.
+    
+    Args:
+        pool (bytes): ASCII characters to draw from (1-256 entries)
+        length (int): Length of each string
+        count (int): Number of strings to generate
+    
+    Returns:
+        list: Generated strings as ASCII bytes
+    """
+    n = len(pool)
+    cutoff = 256 - (256 % n)
+    stride = length * 2
+    buf = os.urandom(count * stride)
+    results = []
+    for i in range(count):
+        out = bytearray(pool[b % n] for b in buf[i * stride:(i + 1) * stride] if b < cutoff)
+        del out[length:]
+        if len(out) < length:
+            out += _random_chars(pool, length - len(out)).encode('ascii')
+        results.append(bytes(out))
+    return results
+
+# Optional Diceware wordlist (e.g. EFF's large list, "11111<TAB>abacus" lines)
+# installed next to this script. Replaces the built-in words when present.
+WORDLIST_FILE = "eff_large_wordlist.txt"
+
+# Built-in word list for memorable passwords
+_BUILTIN_WORDS = (
+    'apple', 'beach', 'cloud', 'dance', 'eagle', 'flame', 'green', 'house',
+    'island', 'jungle', 'knight', 'lemon', 'music', 'night', 'ocean', 'peace',
+    'quiet', 'river', 'stone', 'tiger', 'unity', 'voice', 'water', 'youth',
+    'brave', 'charm', 'dream', 'fairy', 'giant', 'happy', 'magic', 'noble',
+    'quick', 'smart', 'trust', 'vivid', 'wisdom', 'bright', 'calm', 'fresh',
+    'storm', 'lunar', 'solar', 'crystal', 'golden', 'silver', 'forest', 'mountain'
+)
+
+# Words packed into one newline-terminated blob; word i is
+# blob[offsets[i]:offsets[i + 1] - 1]
+_WORDS_PACKED = None
+_BUILTIN_WORDS_PACKED = None
+
+def _pack_words(words):
+    """
+    Pack words into a newline-terminated blob plus an offset array.
+    
+    Args:
+        words (list): Words as ASCII bytes
+    
+    Returns:
+        tuple: (blob, offsets) where offsets has one more entry than words
+    """
+    offsets = array.array('I', [0])
+    for word in words:
+        offsets.append(offsets[-1] + len(word) + 1)
+    return b"\n".join(words) + b"\n", offsets
+
+def _load_builtin_words():
+    """Pack the built-in word list on first use."""
+    global _BUILTIN_WORDS_PACKED
+    if _BUILTIN_WORDS_PACKED is None:
+        _BUILTIN_WORDS_PACKED = _pack_words([word.encode('ascii') for word in _BUILTIN_WORDS])
+    return _BUILTIN_WORDS_PACKED
+
+def _load_words():
+    """
+    Pack the memorable password word list on first use.
+    
+    Lines of the installed wordlist whose word is not plain ASCII are
+    skipped. Falls back to the built-in words if nothing usable is found.
+    
+    Returns:
+        tuple: (blob, offsets) where offsets has one more entry than words
+    """
+    global _WORDS_PACKED
+    if _WORDS_PACKED is None:
+        words = []
+        try:
+            with open(_data_path(WORDLIST_FILE), 'rb') as wordlist:
+                for line in wordlist:
+                    fields = line.split()
+                    if fields and fields[-1].isascii():
+                        words.append(fields[-1])
+        except OSError:
+            pass
+        _WORDS_PACKED = _pack_words(words) if words else _load_builtin_words()
+    return _WORDS_PACKED
 
 class PasswordGenerator:
     """
     A comprehensive password generator with customizable options.
-    Uses the secrets module for cryptographically strong random generation.
+    Uses the operating system CSPRNG (os.urandom, random.SystemRandom) for
+    cryptographically strong random generation.
     """
     
+    # Character sets; the _NOSIM variants drop look-alikes (l/o, I/O, 0/1)
+    _LOWER = b"abcdefghijklmnopqrstuvwxyz"
+    _LOWER_NOSIM = b"abcdefghijkmnpqrstuvwxyz"
+    _UPPER = b"ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    _UPPER_NOSIM = b"ABCDEFGHJKLMNPQRSTUVWXYZ"
+    _DIGITS = b"0123456789"
+    _DIGITS_NOSIM = b"23456789"
+    _SPECIAL = b"!@#$%^&*()_+-=[]{}|;:,.<>?"
+    
     def __init__(self):
-        self.lowercase = string.ascii_lowercase
-        self.uppercase = string.ascii_uppercase
-        self.digits = string.digits
-        self.special_chars = "!@#$%^&*()_+-=[]{}|;:,.<>?"
+        self.lowercase = self._LOWER.decode('ascii')
+        self.uppercase = self._UPPER.decode('ascii')
+        self.digits = self._DIGITS.decode('ascii')
+        self.special_chars = self._SPECIAL.decode('ascii')
+        
+        # Pre-build every character pool combination once, keyed on
+        # (lowercase, uppercase, digits, special, exclude_similar).
+        self._pools = {
+            flags: self._build_pool(*flags)
+            for flags in itertools.product((False, True), repeat=5)
+        }
+        self._sysrand = random.SystemRandom()
+        
+        # Byte -> character class marker: 1=lower, 2=upper, 3=digit, 4=special
+        table = bytearray(256)
+        for marker, chars in ((1, self._LOWER), (2, self._UPPER),
+                              (3, self._DIGITS), (4, self._SPECIAL)):
+            for b in chars:
+                table[b] = marker
+        self._class_trans = bytes(table)
+        
+    def _build_pool(self, use_lowercase, use_uppercase, use_digits,
+                    use_special, exclude_similar):
+        """Build the character pool for one combination of options as bytes."""
+        cls = type(self)
+        return b''.join((
+            (cls._LOWER_NOSIM if exclude_similar else cls._LOWER) if use_lowercase else b'',
+            (cls._UPPER_NOSIM if exclude_similar else cls._UPPER) if use_uppercase else b'',
+            (cls._DIGITS_NOSIM if exclude_similar else cls._DIGITS) if use_digits else b'',
+            cls._SPECIAL if use_special else b'',
+        ))
         
     def generate_password(self, 
                          length=12, 
@@ -58,62 +419,44 @@ class PasswordGenerator:
         if length < 1:
             raise ValueError("Password length must be at least 1")
         
-        char_pool = ""
-        
-        if use_lowercase:
-            chars = self.lowercase
-            if exclude_similar:
-                chars = chars.replace('l', '').replace('o', '')
-            char_pool += chars
-            
-        if use_uppercase:
-            chars = self.uppercase
-            if exclude_similar:
-                chars = chars.replace('I', '').replace('O', '')
-            char_pool += chars
-            
-        if use_digits:
-            chars = self.digits
-            if exclude_similar:
-                chars = chars.replace('0', '').replace('1', '')
-            char_pool += chars
-            
-        if use_special:
-            char_pool += self.special_chars
-        
-        if not char_pool:
+        pool = self._password_pool(use_lowercase, use_uppercase, use_digits,
+                                   use_special, exclude_similar)
+        return _random_chars(pool, length)
+    
+    def _password_pool(self, use_lowercase=True, use_uppercase=True, use_digits=True,
+                       use_special=True, exclude_similar=False):
+        """Return the generate_password() character pool for the given options."""
+        pool = self._pools[(bool(use_lowercase), bool(use_uppercase),
+                            bool(use_digits), bool(use_special),
+                            bool(exclude_similar))]
+        if not pool:
             raise ValueError("At least one character type must be selected")
-        
-        password = ''.join(secrets.choice(char_pool) for _ in range(length))
-        return password
+        return pool
     
     def generate_memorable_password(self, num_words=4, separator='-', capitalize_words=True):
         """
-        Generate a memorable password using common words.
+        Generate a memorable password using distinct common words.
         
         Args:
-            num_words (int): Number of words to use
+            num_words (int): Number of words to use (at most the word list size)
             separator (str): Character to separate words
             capitalize_words (bool): Capitalize first letter of each word
         
         Returns:
             str: Generated memorable password
         """
-        words = [
-            'apple', 'beach', 'cloud', 'dance', 'eagle', 'flame', 'green', 'house',
-            'island', 'jungle', 'knight', 'lemon', 'music', 'night', 'ocean', 'peace',
-            'quiet', 'river', 'stone', 'tiger', 'unity', 'voice', 'water', 'youth',
-            'brave', 'charm', 'dream', 'fairy', 'giant', 'happy', 'magic', 'noble',
-            'quick', 'smart', 'trust', 'vivid', 'wisdom', 'bright', 'calm', 'fresh',
-            'storm', 'lunar', 'solar', 'crystal', 'golden', 'silver', 'forest', 'mountain'
+        blob, offsets = _load_words()
+        if len(offsets) - 1 < num_words:
+            blob, offsets = _load_builtin_words()
+        selected_words = [
+            blob[offsets[i]:offsets[i + 1] - 1].decode('ascii')
+            for i in self._sysrand.sample(range(len(offsets) - 1), num_words)
         ]
         
-        selected_words = [secrets.choice(words) for _ in range(num_words)]
-        
         if capitalize_words:
             selected_words = [word.capitalize() for word in selected_words]
         
-        random_num = secrets.randbelow(100)
+        random_num = self._sysrand.randrange(100)
         password = separator.join(selected_words) + str(random_num)
         return password
     
@@ -127,7 +470,7 @@ class PasswordGenerator:
         Returns:
             str: Generated PIN
         """
-        return ''.join(secrets.choice(self.digits) for _ in range(length))
+        return _random_chars(self._DIGITS, length)
     
     def generate_alphabetic_password(self, length=8, use_uppercase=True, use_lowercase=True):
         """
@@ -141,75 +484,113 @@ class PasswordGenerator:
         Returns:
             str: Generated alphabetic password
         """
-        char_pool = ""
+        return _random_chars(self._alphabetic_pool(use_uppercase, use_lowercase), length)
+    
+    def _alphabetic_pool(self, use_uppercase=True, use_lowercase=True):
+        """Return the generate_alphabetic_password() pool, defaulting to lowercase."""
+        char_pool = self._pools[(bool(use_lowercase), bool(use_uppercase), False, False, False)]
         
-        if use_lowercase:
-            char_pool += self.lowercase
-        if use_uppercase:
-            char_pool += self.uppercase
-            
         if not char_pool:
-            char_pool = self.lowercase
+            char_pool = self._pools[(True, False, False, False, False)]
             
-        return ''.join(secrets.choice(char_pool) for _ in range(length))
+        return char_pool
+    
+    def generate_batch(self, password_type, count, length=12):
+        """
+        Generate many passwords of one type, sharing a single random buffer.
+        
+        Uses the same default options as the single-password generators.
+        
+        Args:
+            password_type (str): 'strong', 'pin', 'alpha' or 'memorable'
+            count (int): Number of passwords to generate
+            length (int): Password length (ignored for memorable passwords)
+        
+        Returns:
+            list: Generated passwords as ASCII bytes
+            
+        Raises:
+            ValueError: If invalid parameters are provided
+        """
+        if count < 1:
+            raise ValueError("Count must be at least 1")
+        
+        if password_type == 'memorable':
+            return [self.generate_memorable_password().encode('ascii') for _ in range(count)]
+        
+        if length < 1:
+            raise ValueError("Password length must be at least 1")
+        
+        if password_type == 'strong':
+            pool = self._password_pool()
+        elif password_type == 'pin':
+            pool = self._DIGITS
+        elif password_type == 'alpha':
+            pool = self._alphabetic_pool()
+        else:
+            raise ValueError(f"Unknown password type: {password_type}")
+        
+        return _random_chars_batch(pool, length, count)
     
     def check_password_strength(self, password):
         """
         Evaluate password strength and provide feedback.
         
+        Uses zxcvbn scoring (0-4) when zxcvbn-rs-py or zxcvbn is installed,
+        otherwise falls back to the built-in rule-based score (0-8).
+        
         Args:
             password (str): Password to evaluate
         
         Returns:
             dict: Comprehensive strength analysis results
         """
-        score = 0
-        feedback = []
-        
-        if len(password) >= 16:
-            score += 3
-        elif len(password) >= 12:
-            score += 2
-        elif len(password) >= 8:
-            score += 1
-        else:
-            feedback.append("Password should be at least 8 characters long")
-        
-        has_lower = any(c.islower() for c in password)
-        has_upper = any(c.isupper() for c in password)
-        has_digit = any(c.isdigit() for c in password)
-        has_special = any(c in self.special_chars for c in password)
-        
-        char_types = sum([has_lower, has_upper, has_digit, has_special])
-        score += char_types
-        
-        if char_types < 3:
-            feedback.append("Use a mix of uppercase, lowercase, numbers, and special characters")
-        
-        # Check for common patterns
-        if password.lower() in ['password', '123456', 'qwerty', 'abc123']:
-            score = max(0, score - 3)
-            feedback.append("Avoid common password patterns")
-        
-        # Determine strength level and color
-        if score >= 7:
-            strength = "Very Strong"
-            color = "\033[92m"  # Green
-        elif score >= 5:
-            strength = "Strong"
-            color = "\033[93m"  # Yellow
-        elif score >= 3:
-            strength = "Medium"
-            color = "\033[94m"  # Blue
+        present = set(password.encode('utf-8', 'ignore').translate(self._class_trans))
+        present.discard(0)
+        
+        has_lower = 1 in present
+        has_upper = 2 in present
+        has_digit = 3 in present
+        has_special = 4 in present
+        
+        # Empty input goes to the rule-based scorer (zxcvbn 4.5.0 raises on it)
+        zxcvbn = _load_zxcvbn() if password else None
+        if zxcvbn is not None:
+            score, feedback = zxcvbn(password)
+            max_score = 4
+            idx = _ZXCVBN_LEVELS[score]
+            strength = _LABELS[idx]
+            color = _COLORS[idx]
         else:
-            strength = "Weak"
-            color = "\033[91m"  # Red
+            score = 0
+            max_score = 8
+            feedback = []
+            
+            score += _LEN_SCORE_LUT[min(len(password), 64)]
+            if len(password) < 8:
+                feedback.append("Password should be at least 8 characters long")
+            
+            char_types = len(present)
+            score += char_types
+            
+            if char_types < 3:
+                feedback.append("Use a mix of uppercase, lowercase, numbers, and special characters")
+            
+            # Check for common patterns
+            if _is_common_password(password):
+                score = max(0, score - 3)
+                feedback.append("Avoid common password patterns")
+            
+            # Determine strength level and color
+            idx = (score >= 3) + (score >= 5) + (score >= 7)
+            strength = _LABELS[idx]
+            color = _COLORS[idx]
         
         return {
             'strength': strength,
             'color': color,
             'score': score,
-            'max_score': 8,
+            'max_score': max_score,
             'feedback': feedback,
             'has_lowercase': has_lower,
             'has_uppercase': has_upper,
@@ -218,26 +599,21 @@ class PasswordGenerator:
             'length': len(password)
         }
 
-class TerminalGUI:
-    """Terminal-based graphical user interface for the password generator."""
-    
-    def __init__(self):
-        self.generator = PasswordGenerator()
-        self.reset_color = "\033[0m"
-        self.title_color = "\033[96m"
-        self.menu_color = "\033[95m"
-        self.input_color = "\033[94m"
-        self.success_color = "\033[92m"
-        self.error_color = "\033[91m"
-        self.warning_color = "\033[93m"
-        
-    def clear_screen(self):
-        """Clear the terminal screen."""
-        os.system('clear')
-        
-    def print_logo(self):
-        """Print the ASCII art logo with branding."""
-        logo = f"""{self.title_color}
+@functools.lru_cache(maxsize=128)
+def _box_border(n):
+    """Return a horizontal box border of n characters."""
+    return '─' * n
+
+# Terminal colors
+RESET_COLOR = "\033[0m"
+TITLE_COLOR = "\033[96m"
+MENU_COLOR = "\033[95m"
+INPUT_COLOR = "\033[94m"
+SUCCESS_COLOR = "\033[92m"
+ERROR_COLOR = "\033[91m"
+WARNING_COLOR = "\033[93m"
+
+_LOGO_RENDERED = f"""{TITLE_COLOR}
 ╔═══════════════════════════════════════════════════════════════╗
 ║                                                               ║
 ║  ██████╗  █████╗ ███████╗███████╗██╗    ██╗ ██████╗ ██████╗  ║
@@ -258,27 +634,49 @@ class TerminalGUI:
 ║                        Termux Edition                        ║
 ║                          v1.0.0                              ║
 ╚═══════════════════════════════════════════════════════════════╝
-{self.reset_color}"""
-        print(logo)
-        
-    def print_menu(self):
-        """Print the main menu options."""
-        menu = f"""
-{self.menu_color}═══════════════════════════════════════════════════════════════
+{RESET_COLOR}"""
+
+_MENU_RENDERED = f"""
+{MENU_COLOR}═══════════════════════════════════════════════════════════════
                             MAIN MENU
-═══════════════════════════════════════════════════════════════{self.reset_color}
+═══════════════════════════════════════════════════════════════{RESET_COLOR}
 
-{self.input_color}[1]{self.reset_color} Generate Strong Password (Mixed Characters)
-{self.input_color}[2]{self.reset_color} Generate PIN (Numbers Only)
-{self.input_color}[3]{self.reset_color} Generate Alphabetic Password (Letters Only)
-{self.input_color}[4]{self.reset_color} Generate Memorable Password (Word-based)
-{self.input_color}[5]{self.reset_color} Check Password Strength
-{self.input_color}[6]{self.reset_color} About & Information
-{self.input_color}[7]{self.reset_color} Exit Application
+{INPUT_COLOR}[1]{RESET_COLOR} Generate Strong Password (Mixed Characters)
+{INPUT_COLOR}[2]{RESET_COLOR} Generate PIN (Numbers Only)
+{INPUT_COLOR}[3]{RESET_COLOR} Generate Alphabetic Password (Letters Only)
+{INPUT_COLOR}[4]{RESET_COLOR} Generate Memorable Password (Word-based)
+{INPUT_COLOR}[5]{RESET_COLOR} Check Password Strength
+{INPUT_COLOR}[6]{RESET_COLOR} About & Information
+{INPUT_COLOR}[7]{RESET_COLOR} Exit Application
 
-{self.menu_color}═══════════════════════════════════════════════════════════════{self.reset_color}
+{MENU_COLOR}═══════════════════════════════════════════════════════════════{RESET_COLOR}
         """
-        print(menu)
+
+class TerminalGUI:
+    """Terminal-based graphical user interface for the password generator."""
+    
+    def __init__(self):
+        self.generator = PasswordGenerator()
+        self.reset_color = RESET_COLOR
+        self.title_color = TITLE_COLOR
+        self.menu_color = MENU_COLOR
+        self.input_color = INPUT_COLOR
+        self.success_color = SUCCESS_COLOR
+        self.error_color = ERROR_COLOR
+        self.warning_color = WARNING_COLOR
+        
+    def clear_screen(self):
+        """Clear the terminal screen."""
+        sys.stdout.write("\033[2J\033[H")
+        sys.stdout.flush()
+        
+    def print_logo(self):
+        """Print the ASCII art logo with branding."""
+        print(_LOGO_RENDERED)
+        
+    def print_menu(self):
+        """Print the main menu options."""
+        print(_MENU_RENDERED)
         
     def get_input(self, prompt, input_type=str, default=None, valid_range=None):
         """
@@ -317,18 +715,19 @@ class TerminalGUI:
                 print(f"\n{self.warning_color}Operation cancelled by user.{self.reset_color}")
                 return None
                 
-    def display_password_result(self, password, title="Generated Password"):
+    def display_password_result(self, password, title="Generated Password", *, skip_strength=False):
         """Display password result with professional formatting."""
         if not password:
             return
             
+        border = _box_border(len(password) + 2)
         print(f"\n{self.success_color}{title}:{self.reset_color}")
-        print(f"┌{'─' * (len(password) + 2)}┐")
+        print(f"┌{border}┐")
         print(f"│ {password} │")
-        print(f"└{'─' * (len(password) + 2)}┘")
+        print(f"└{border}┘")
         
-        # Show strength analysis for non-PIN passwords
-        if not title.lower().startswith("generated pin"):
+        # Show strength analysis unless the caller opted out (e.g. PINs)
+        if not skip_strength:
             strength = self.generator.check_password_strength(password)
             print(f"\nStrength Assessment: {strength['color']}{strength['strength']}{self.reset_color} ({strength['score']}/{strength['max_score']})")
             
@@ -372,7 +771,7 @@ class TerminalGUI:
             return
             
         pin = self.generator.generate_pin(length)
-        self.display_password_result(pin, "Generated PIN")
+        self.display_password_result(pin, "Generated PIN", skip_strength=True)
         
     def generate_alphabetic_password(self):
         """Handle alphabetic password generation."""
@@ -460,7 +859,7 @@ Version: 1.0.0
 Platform: Termux (Android Terminal Emulator)
 
 {self.menu_color}Security Features:{self.reset_color}
-• Cryptographically secure random generation using Python secrets module
+• Cryptographically secure random generation using the operating system CSPRNG
 • Multiple password generation methods for diverse requirements
 • Comprehensive password strength analysis with detailed feedback
 • Professional terminal interface with color-coded output
@@ -529,46 +928,64 @@ def main():
     Application entry point with argument parsing support.
     Provides both interactive and command-line interfaces.
     """
-    parser = argparse.ArgumentParser(
-        description='Password Generator - Secure password generation for Termux',
-        epilog='For interactive mode, run without arguments.'
-    )
-    
-    parser.add_argument('--version', action='version', version='Password Generator 1.0.0')
-    parser.add_argument('--generate', '-g', choices=['strong', 'pin', 'alpha', 'memorable'],
-                       help='Generate password of specified type')
-    parser.add_argument('--length', '-l', type=int, default=16,
-                       help='Password length (default: 16)')
-    parser.add_argument('--check', '-c', metavar='PASSWORD',
-                       help='Check strength of provided password')
-    
-    args = parser.parse_args()
-    
-    # Command line mode
-    if args.generate or args.check:
-        generator = PasswordGenerator()
-        
-        if args.check:
-            analysis = generator.check_password_strength(args.check)
-            print(f"Password Strength: {analysis['strength']} ({analysis['score']}/{analysis['max_score']})")
-            if analysis['feedback']:
-                print("Recommendations:")
-                for suggestion in analysis['feedback']:
-                    print(f"• {suggestion}")
-            return
+    # Command line mode; argparse is only imported when arguments are given
+    if len(sys.argv) > 1:
+        import argparse
         
-        if args.generate == 'strong':
-            password = generator.generate_password(length=args.length)
-        elif args.generate == 'pin':
-            password = generator.generate_pin(length=min(args.length, 10))
-        elif args.generate == 'alpha':
-            password = generator.generate_alphabetic_password(length=args.length)
-        elif args.generate == 'memorable':
-            password = generator.generate_memorable_password()
+        parser = argparse.ArgumentParser(
+            description='Password Generator - Secure password generation for Termux',
+            epilog='For interactive mode, run without arguments.'
+        )
+        
+        parser.add_argument('--version', action='version', version='Password Generator 1.0.0')
+        parser.add_argument('--generate', '-g', choices=['strong', 'pin', 'alpha', 'memorable'],
+                           help='Generate password of specified type')
+        parser.add_argument('--length', '-l', type=int, default=16,
+                           help='Password length (default: 16)')
+        parser.add_argument('--check', '-c', metavar='PASSWORD',
+                           help='Check strength of provided password')
+        parser.add_argument('--count', '-n', type=int, default=1,
+                           help='Number of passwords to generate (default: 1)')
+        
+        args = parser.parse_args()
+        
+        if args.count < 1:
+            parser.error("--count must be at least 1")
+        if args.generate and args.length < 1:
+            parser.error("--length must be at least 1")
+        
+        # PINs are capped at 10 digits
+        length = min(args.length, 10) if args.generate == 'pin' else args.length
+        
+        if args.generate or args.check:
+            generator = PasswordGenerator()
+            
+            if args.check:
+                analysis = generator.check_password_strength(args.check)
+                print(f"Password Strength: {analysis['strength']} ({analysis['score']}/{analysis['max_score']})")
+                if analysis['feedback']:
+                    print("Recommendations:")
+                    for suggestion in analysis['feedback']:
+                        print(f"• {suggestion}")
+                return
+            
+            if args.count > 1:
+                results = generator.generate_batch(args.generate, args.count, length)
+                sys.stdout.buffer.write(b"\n".join(results) + b"\n")
+                return
+            
+            if args.generate == 'strong':
+                password = generator.generate_password(length=length)
+            elif args.generate == 'pin':
+                password = generator.generate_pin(length=length)
+            elif args.generate == 'alpha':
+                password = generator.generate_alphabetic_password(length=length)
+            elif args.generate == 'memorable':
+                password = generator.generate_memorable_password()
+            
+            print(password)
+            return
         
-        print(password)
-        return
-    
     # Interactive mode
     try:
         gui = TerminalGUI()